@@ -2,6 +2,7 @@ import graphene
 from graphene_django import DjangoObjectType
 from .models import Product
 from crm.models import Product
+from crm.caching import invalidate_products
 
 class CRMQuery(graphene.ObjectType):
     """
@@ -42,23 +43,19 @@ class UpdateLowStockProducts(graphene.Mutation):
     updated_products = graphene.List(UpdatedProductType)
     
     def mutate(self, info):
-        # Query products with stock < 10
-        low_stock_products = Product.objects.filter(stock__lt=10)
+        # Increment stock by 10 for all products with stock < 10 in one UPDATE
+        previous = Product.restock_low_stock()
+        invalidate_products()
         
-        updated_products = []
-        
-        # Update each low-stock product
-        for product in low_stock_products:
-            previous_stock = product.stock
-            product.stock += 10  # Increment stock by 10
-            product.save()
-            
-            updated_products.append(UpdatedProductType(
-                id=product.id,
-                name=product.name,
-                stock=product.stock,
-                previous_stock=previous_stock
-            ))
+        updated_products = [
+            UpdatedProductType(
+                id=product['id'],
+                name=product['name'],
+                stock=product['stock'] + 10,
+                previous_stock=product['stock']
+            )
+            for product in previous
+        ]
         
         if updated_products:
             message = f"Successfully restocked {len(updated_products)} low-stock products"
@@ -52,7 +52,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'graphql.urls'
+ROOT_URLCONF = 'alx_backend_graphql.urls'
 
 TEMPLATES = [
     {
@@ -69,7 +69,7 @@ TEMPLATES = [
     },
 ]
 
-WSGI_APPLICATION = 'graphql.wsgi.application'
+WSGI_APPLICATION = 'alx_backend_graphql.wsgi.application'
 
 
 # Database
@@ -123,3 +123,52 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# File-based so the web server and cron processes share one cache and
+# invalidation from either reaches the other.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': '/tmp/crm_cache',
+    }
+}
+
+
+# GraphQL
+# Worker threads shared by all requests for resolving top-level query fields
+# in parallel (see crm.execution). Set CONN_MAX_AGE to let them reuse
+# database connections between fields.
+
+GRAPHQL_EXECUTOR_WORKERS = 4
+
+
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'crm_file': {
+            'class': 'logging.FileHandler',
+            'filename': '/tmp/crm_log.txt',
+        },
+        # Collect records in memory and flush them to the file in batches
+        'crm_buffered': {
+            'class': 'logging.handlers.MemoryHandler',
+            'capacity': 100,
+            'flushLevel': 'ERROR',
+            'target': 'crm_file',
+        },
+    },
+    'loggers': {
+        'crm': {
+            'handlers': ['crm_buffered'],
+            'level': 'DEBUG' if DEBUG else 'INFO',
+        },
+    },
+}
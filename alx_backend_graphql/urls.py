@@ -14,9 +14,21 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path
+from django.urls import path, re_path
+from django.views.decorators.csrf import csrf_exempt
+
+from crm.execution import ParallelExecutionContext
+from crm.schema import schema
+from crm.views import PersistedGraphQLView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # Cron jobs post to both /graphql and /graphql/
+    re_path(r'^graphql/?$', csrf_exempt(PersistedGraphQLView.as_view(
+        graphiql=settings.DEBUG,
+        schema=schema,
+        execution_context_class=ParallelExecutionContext,
+    ))),
 ]
@@ -4,6 +4,19 @@ Django-crontab job functions for CRM application.
 
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Timeout (seconds) for GraphQL requests made by the cron jobs
+HTTP_TIMEOUT = 5
+
+# Shared HTTP session so requests reuse a pooled keep-alive connection
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
 
 
 def log_crm_heartbeat():
@@ -26,7 +39,7 @@ def log_crm_heartbeat():
         query = {
             "query": "{ hello }"
         }
-        response = requests.post(graphql_url, json=query, timeout=5)
+        response = _HTTP.post(graphql_url, json=query, timeout=HTTP_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
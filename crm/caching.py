@@ -0,0 +1,35 @@
+"""
+Read-through cache for slowly changing CRM query results.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Product
+
+PRODUCTS_CACHE_KEY = 'crm:products:all'
+
+# Seconds a cached product list is served before it is reloaded
+PRODUCTS_CACHE_TIMEOUT = 60
+
+
+def cached_products():
+    """Return all products, loading them from the database at most once per timeout."""
+    return cache.get_or_set(
+        PRODUCTS_CACHE_KEY,
+        lambda: list(Product.objects.all()),
+        PRODUCTS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_products():
+    """Drop the cached product list after products are created or changed."""
+    cache.delete(PRODUCTS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_products_on_change(sender, **kwargs):
+    """Invalidate on every saved or deleted product, including admin edits."""
+    invalidate_products()
@@ -2,9 +2,12 @@
 Celery configuration for CRM application.
 """
 
+import logging
 import os
 from celery import Celery
 
+log = logging.getLogger(__name__)
+
 # Set the default Django settings module
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'crm.settings')
 
@@ -21,4 +24,4 @@ app.autodiscover_tasks()
 @app.task(bind=True)
 def debug_task(self):
     """Debug task to test Celery setup"""
-    print(f'Request: {self.request!r}')
+    log.debug('Request: %r', self.request)
@@ -4,42 +4,55 @@ Django-crontab job functions for CRM application.
 
 from datetime import datetime
 import requests
-from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from crm.caching import invalidate_products
+from crm.models import Product
+from crm.persisted_queries import HEARTBEAT_QUERY, query_id
+
+# Persisted id of the heartbeat query, hashed once at import
+HEARTBEAT_QUERY_ID = query_id(HEARTBEAT_QUERY)
+
+# Timeout (seconds) for GraphQL requests made by the cron jobs
+HTTP_TIMEOUT = 5
+
+# Shared HTTP session so requests reuse a pooled keep-alive connection
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
+
+# Write buffer size for the cron log files
+LOG_BUFFER_SIZE = 65536
 
 
 def update_low_stock():
-    url = settings.GRAPHQL_URL  # You will define this in settings.py
-
-    query = """
-    mutation {
-        updateLowStockProducts {
-            message
-            updatedProducts {
-                name
-                stock
-            }
-        }
-    }
     """
+    Restock products with stock below 10 directly through the ORM.
+    The cron job runs alongside Django, so no HTTP/GraphQL round-trip is needed.
+    """
+    log_path = "/tmp/low_stock_updates_log.txt"
 
-    response = requests.post(url, json={"query": query})
-    data = response.json()
+    # Build the whole entry first so it is written in one call
+    entry = ["\n\n=== Update Run: " + str(datetime.now()) + " ===\n"]
 
-    log_path = "/tmp/low_stock_updates_log.txt"
+    try:
+        updated = Product.restock_low_stock()
+        invalidate_products()
 
-    with open(log_path, "a") as file:
-        file.write("\n\n=== Update Run: " + str(datetime.now()) + " ===\n")
+        for product in updated:
+            entry.append(f"{product['name']} → New Stock: {product['stock'] + 10}\n")
 
-        try:
-            updated = data["data"]["updateLowStockProducts"]["updatedProducts"]
-            for product in updated:
-                file.write(f"{product['name']} → New Stock: {product['stock']}\n")
+        entry.append("Status: SUCCESS\n")
 
-            file.write("Status: SUCCESS\n")
+    except Exception as e:
+        entry.append("Error: " + str(e) + "\n")
 
-        except Exception as e:
-            file.write("Error: " + str(e) + "\n")
-            file.write("Raw response: " + str(data) + "\n")
+    with open(log_path, "a", buffering=LOG_BUFFER_SIZE) as file:
+        file.write("".join(entry))
 
 
 def log_crm_heartbeat():
@@ -59,10 +72,9 @@ def log_crm_heartbeat():
     # Optional: Query GraphQL endpoint to verify it's responsive
     try:
         graphql_url = "http://localhost:8000/graphql"
-        query = {
-            "query": "{ hello }"
-        }
-        response = requests.post(graphql_url, json=query, timeout=5)
+        # Send the persisted query id instead of the full query text
+        payload = {"id": HEARTBEAT_QUERY_ID}
+        response = _HTTP.post(graphql_url, json=payload, timeout=HTTP_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -74,5 +86,5 @@ def log_crm_heartbeat():
         message += f" - GraphQL endpoint check failed: {str(e)}"
     
     # Append to log file
-    with open(log_file, 'a') as f:
+    with open(log_file, 'a', buffering=LOG_BUFFER_SIZE) as f:
         f.write(message + '\n')
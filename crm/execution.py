@@ -0,0 +1,79 @@
+"""
+GraphQL execution context that resolves top-level query fields concurrently.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from graphql import ExecutionContext, get_named_type, is_leaf_type
+from graphql.pyutils import Path, Undefined
+
+# Shared by all requests. Every multi-field query from every request thread
+# queues on these workers, so size GRAPHQL_EXECUTOR_WORKERS to the number of
+# request threads times the root fields they typically run in parallel.
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'GRAPHQL_EXECUTOR_WORKERS', 4),
+    thread_name_prefix='graphql',
+)
+
+
+class ParallelExecutionContext(ExecutionContext):
+    """
+    Run top-level query fields that return objects in the shared worker pool.
+    Independent lists (e.g. allCustomers, allProducts, allOrders) are fetched
+    in parallel; scalar fields such as hello and all nested fields resolve in
+    the request thread. Mutations are unaffected, they always execute serially.
+    Inside a transaction (ATOMIC_REQUESTS, tests) everything runs serially,
+    since worker connections cannot see uncommitted rows.
+    """
+
+    def execute_fields(self, parent_type, source_value, path, fields):
+        if path is not None or connection.in_atomic_block:
+            return super().execute_fields(parent_type, source_value, path, fields)
+
+        parallel = [
+            response_name for response_name, field_nodes in fields.items()
+            if self._hits_database(parent_type, field_nodes)
+        ]
+        if len(parallel) < 2:
+            return super().execute_fields(parent_type, source_value, path, fields)
+
+        futures = {
+            response_name: _executor.submit(
+                self._execute_root_field,
+                parent_type,
+                source_value,
+                fields[response_name],
+                Path(None, response_name, parent_type.name),
+            )
+            for response_name in parallel
+        }
+
+        results = {}
+        for response_name, field_nodes in fields.items():
+            if response_name in futures:
+                result = futures[response_name].result()
+            else:
+                result = self.execute_field(
+                    parent_type,
+                    source_value,
+                    field_nodes,
+                    Path(None, response_name, parent_type.name),
+                )
+            if result is not Undefined:
+                results[response_name] = result
+        return results
+
+    @staticmethod
+    def _hits_database(parent_type, field_nodes):
+        field_def = parent_type.fields.get(field_nodes[0].name.value)
+        return field_def is not None and not is_leaf_type(get_named_type(field_def.type))
+
+    def _execute_root_field(self, parent_type, source_value, field_nodes, path):
+        # Apply CONN_MAX_AGE and CONN_HEALTH_CHECKS as Django does per request
+        close_old_connections()
+        try:
+            return self.execute_field(parent_type, source_value, field_nodes, path)
+        finally:
+            close_old_connections()
@@ -0,0 +1,35 @@
+"""
+Per-request loaders that share model lookups between GraphQL resolvers.
+"""
+
+from .models import Customer
+
+
+class CustomerLoader:
+    """Cache customers by id for the lifetime of a single request."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def load_many(self, ids):
+        """Return customers for the given ids, fetching unseen ones in one query."""
+        missing = [pk for pk in set(ids) if pk not in self._cache]
+        if missing:
+            found = Customer.objects.in_bulk(missing)
+            for pk in missing:
+                self._cache[pk] = found.get(pk)
+        return [self._cache[pk] for pk in ids]
+
+    def load(self, pk):
+        return self.load_many([pk])[0]
+
+
+def get_customer_loader(context):
+    """Return the customer loader attached to the request, creating it if needed."""
+    if context is None:
+        return CustomerLoader()
+    loader = getattr(context, 'customer_loader', None)
+    if loader is None:
+        loader = CustomerLoader()
+        context.customer_loader = loader
+    return loader
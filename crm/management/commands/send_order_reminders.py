@@ -0,0 +1,57 @@
+"""
+Management command to send order reminders for orders from the last 7 days.
+Reads orders directly through the ORM and logs results.
+"""
+
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from crm.models import Order
+
+# Log file path
+LOG_FILE = "/tmp/order_reminders_log.txt"
+
+# Write buffer size for the log file
+LOG_BUFFER_SIZE = 65536
+
+
+def get_pending_orders():
+    """
+    Return id, date and customer email of orders from the last 7 days.
+    """
+    seven_days_ago = timezone.now() - timedelta(days=7)
+    return list(
+        Order.objects.filter(order_date__gte=seven_days_ago)
+        .values('id', 'order_date', 'customer__email')
+    )
+
+
+def log_order_reminders(orders):
+    """
+    Log order reminders to the log file.
+    """
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    # Pre-format every line so the buffered file flushes them together
+    if orders:
+        lines = [f"\n[{timestamp}] Processing {len(orders)} pending orders:\n"]
+        lines.extend(
+            f"  - Order ID: {order['id']}, "
+            f"Customer Email: {order['customer__email'] or 'N/A'}\n"
+            for order in orders
+        )
+    else:
+        lines = [f"\n[{timestamp}] No pending orders found.\n"]
+
+    with open(LOG_FILE, 'a', buffering=LOG_BUFFER_SIZE) as log_file:
+        log_file.writelines(lines)
+
+
+class Command(BaseCommand):
+    help = "Log reminders for orders placed in the last 7 days."
+
+    def handle(self, *args, **options):
+        log_order_reminders(get_pending_orders())
+        self.stdout.write("Order reminders processed!")
@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 
@@ -37,6 +39,20 @@ class Product(models.Model):
     def __str__(self):
         return f"{self.name} - ${self.price}"
 
+    @classmethod
+    def restock_low_stock(cls, threshold=10, amount=10):
+        """
+        Add `amount` to the stock of every product below `threshold` in one UPDATE.
+        Returns the restocked products as dicts with id, name and previous stock.
+        """
+        with transaction.atomic():
+            low_stock = cls.objects.select_for_update().filter(stock__lt=threshold)
+            restocked = list(low_stock.values('id', 'name', 'stock'))
+            cls.objects.filter(
+                id__in=[product['id'] for product in restocked]
+            ).update(stock=F('stock') + amount, updated_at=timezone.now())
+        return restocked
+
     class Meta:
         ordering = ['name']
 
@@ -63,9 +79,9 @@ class Order(models.Model):
 
     def calculate_total(self):
         """Calculate total amount from associated products."""
-        total = sum(product.price for product in self.products.all())
+        total = self.products.aggregate(total=Sum('price'))['total'] or Decimal('0.00')
         self.total_amount = total
-        self.save()
+        self.save(update_fields=['total_amount', 'updated_at'])
         return total
 
     class Meta:
@@ -0,0 +1,21 @@
+"""
+Persisted GraphQL operations used by the CRM cron jobs.
+
+Clients send {"id": <sha256 of the query>, "variables": {...}} instead of the
+full query text; the GraphQL view looks the query up here by its id.
+"""
+
+import hashlib
+
+
+def query_id(query):
+    """Return the persisted id (sha256 hex digest) for a query string."""
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+HEARTBEAT_QUERY = "{ hello }"
+
+PERSISTED_QUERIES = {
+    query_id(query): query
+    for query in (HEARTBEAT_QUERY,)
+}
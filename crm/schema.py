@@ -1,12 +1,17 @@
 # crm/schema.py
 
 import graphene
+from graphene.utils.str_converters import to_snake_case
 from graphene_django import DjangoObjectType
+from graphql import GraphQLError
+from graphql.language import FieldNode
 from django.core.validators import validate_email
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import transaction
 from decimal import Decimal
 import re
+from .caching import cached_products, invalidate_products
+from .loaders import get_customer_loader
 from .models import Customer, Product, Order
 from crm.models import Product
 from django.utils import timezone
@@ -33,13 +38,10 @@ class UpdateLowStockProducts(graphene.Mutation):
 
     @classmethod
     def mutate(cls, root, info):
-        low_stock_products = Product.objects.filter(stock__lt=10)
-
-        updated = []
-        for product in low_stock_products:
-            product.stock += 10
-            product.save()
-            updated.append(product)
+        # Restock in a single UPDATE statement
+        restocked = Product.restock_low_stock()
+        invalidate_products()
+        updated = list(Product.objects.filter(id__in=[product['id'] for product in restocked]))
 
         return UpdateLowStockProducts(
             message=f"{len(updated)} products updated successfully",
@@ -54,6 +56,13 @@ class OrderType(DjangoObjectType):
         model = Order
         fields = ("id", "customer", "products", "total_amount", "order_date")
 
+    def resolve_customer(self, info):
+        # Use the customer already attached to the order (by the list resolvers
+        # or CreateOrder)
+        if Order.customer.is_cached(self):
+            return self.customer
+        return get_customer_loader(info.context).load(self.customer_id)
+
 
 # ==================== Input Types ====================
 
@@ -77,6 +86,9 @@ class OrderInput(graphene.InputObjectType):
 
 # ==================== Utility Functions ====================
 
+PHONE_RE = re.compile(r'^(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}$')
+
+
 def validate_phone(phone):
     """
     Validate phone number format.
@@ -84,8 +96,82 @@ def validate_phone(phone):
     """
     if not phone:
         return True
-    pattern = r'^(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}$'
-    return bool(re.match(pattern, phone))
+    return bool(PHONE_RE.match(phone))
+
+
+def selected_fields(info, model):
+    """
+    Return the names of the model fields requested in the current selection.
+    Returns None if the selection cannot be resolved (e.g. uses fragments).
+    """
+    fields = set()
+    # A field requested more than once is merged into several nodes
+    for field_node in info.field_nodes:
+        if field_node.selection_set is None:
+            return None
+        for selection in field_node.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return None
+            name = to_snake_case(selection.name.value)
+            try:
+                model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            fields.add(name)
+    return fields
+
+
+def only_selected(queryset, fields):
+    """Restrict the queryset to the selected concrete columns."""
+    if fields is None:
+        return queryset
+    meta = queryset.model._meta
+    columns = [
+        name for name in fields
+        if meta.get_field(name).concrete and not meta.get_field(name).many_to_many
+    ]
+    return queryset.only(meta.pk.name, *columns)
+
+
+def paginate(queryset, first=None, offset=None):
+    """Slice the queryset to at most `first` rows starting at `offset`."""
+    if first is not None and first < 0:
+        raise GraphQLError("Argument 'first' must not be negative")
+    if offset is not None and offset < 0:
+        raise GraphQLError("Argument 'offset' must not be negative")
+    offset = offset or 0
+    if first is not None:
+        return queryset[offset:offset + first]
+    if offset:
+        return queryset[offset:]
+    return queryset
+
+
+def order_queryset(info):
+    """Orders queryset prefetching products only when they were selected."""
+    fields = selected_fields(info, Order)
+    orders = only_selected(Order.objects.all(), fields)
+    if fields is None or 'products' in fields:
+        orders = orders.prefetch_related('products')
+    return orders
+
+
+def load_order_customers(info, orders):
+    """
+    Evaluate a page of orders and fetch all of their customers in one query.
+    Each customer is attached to its order, so OrderType.resolve_customer
+    serves it from the cached relation.
+    """
+    orders = list(orders)
+    fields = selected_fields(info, Order)
+    if fields is None or 'customer' in fields:
+        customers = get_customer_loader(info.context).load_many(
+            [order.customer_id for order in orders]
+        )
+        for order, customer in zip(orders, customers):
+            if customer is not None:
+                order.customer = customer
+    return orders
 
 
 # ==================== Mutations ====================
@@ -162,14 +248,27 @@ class BulkCreateCustomers(graphene.Mutation):
         customers = []
         errors = []
 
-        # Process each customer individually
+        # Fetch every colliding email in one query instead of one per row
+        emails = [customer_data.email for customer_data in input]
+        existing_emails = set(
+            Customer.objects.filter(email__in=emails).values_list('email', flat=True)
+        )
+        seen_emails = set()
+
+        # Validate each customer in memory
         for idx, customer_data in enumerate(input):
             try:
+                # Reject duplicates within the batch before any other work
+                if customer_data.email in seen_emails:
+                    errors.append(f"Row {idx + 1}: Email {customer_data.email} is duplicated in this batch")
+                    continue
+                seen_emails.add(customer_data.email)
+
                 # Validate email format
                 validate_email(customer_data.email)
 
                 # Check if email already exists
-                if Customer.objects.filter(email=customer_data.email).exists():
+                if customer_data.email in existing_emails:
                     errors.append(f"Row {idx + 1}: Email {customer_data.email} already exists")
                     continue
 
@@ -178,19 +277,26 @@ class BulkCreateCustomers(graphene.Mutation):
                     errors.append(f"Row {idx + 1}: Invalid phone format for {customer_data.email}")
                     continue
 
-                # Create customer
-                customer = Customer.objects.create(
+                customers.append(Customer(
                     name=customer_data.name,
                     email=customer_data.email,
                     phone=customer_data.phone if customer_data.phone else None
-                )
-                customers.append(customer)
+                ))
 
             except ValidationError as e:
                 errors.append(f"Row {idx + 1}: Validation error - {str(e)}")
             except Exception as e:
                 errors.append(f"Row {idx + 1}: Error - {str(e)}")
 
+        # Create all valid customers in a single insert
+        if customers:
+            try:
+                with transaction.atomic():
+                    customers = Customer.objects.bulk_create(customers, batch_size=500)
+            except Exception as e:
+                errors.append(f"Error - {str(e)}")
+                customers = []
+
         return BulkCreateCustomers(
             customers=customers,
             errors=errors if errors else None,
@@ -278,35 +384,39 @@ class CreateOrder(graphene.Mutation):
                     success=False
                 )
 
-            # Validate all products exist
-            products = []
-            for product_id in input.product_ids:
-                try:
-                    product = Product.objects.get(pk=product_id)
-                    products.append(product)
-                except Product.DoesNotExist:
-                    return CreateOrder(
-                        order=None,
-                        message=f"Invalid product ID: {product_id}",
-                        success=False
-                    )
+            # Validate all products exist (single query for the whole list)
+            products = list(Product.objects.filter(pk__in=input.product_ids))
+            prices = {str(product.pk): product.price for product in products}
+            found_ids = prices.keys()
+            missing_ids = [
+                str(product_id) for product_id in input.product_ids
+                if str(product_id) not in found_ids
+            ]
+            if missing_ids:
+                return CreateOrder(
+                    order=None,
+                    message=f"Invalid product ID(s): {', '.join(missing_ids)}",
+                    success=False
+                )
 
             # Create order in a transaction
             with transaction.atomic():
-                # Create order
+                # Calculate total amount, charging once per listed product ID
+                total = sum(
+                    (prices[str(product_id)] for product_id in input.product_ids),
+                    Decimal('0')
+                )
+
+                # Create order with its total in the initial INSERT
                 order = Order.objects.create(
                     customer=customer,
-                    order_date=input.order_date if hasattr(input, 'order_date') and input.order_date else None
+                    order_date=input.order_date if hasattr(input, 'order_date') and input.order_date else None,
+                    total_amount=total
                 )
 
                 # Associate products
                 order.products.set(products)
 
-                # Calculate total amount
-                total = sum(product.price for product in products)
-                order.total_amount = total
-                order.save()
-
             return CreateOrder(
                 order=order,
                 message="Order created successfully",
@@ -334,9 +444,10 @@ class Query(graphene.ObjectType):
     order = graphene.Field(OrderType, id=graphene.ID(required=True))
 
     # List queries
-    all_customers = graphene.List(CustomerType)
-    all_products = graphene.List(ProductType)
-    all_orders = graphene.List(OrderType)
+    all_customers = graphene.List(CustomerType, first=graphene.Int(), offset=graphene.Int())
+    all_products = graphene.List(ProductType, first=graphene.Int(), offset=graphene.Int())
+    all_orders = graphene.List(OrderType, first=graphene.Int(), offset=graphene.Int())
+    orders = graphene.List(OrderType, order_date__gte=graphene.String())
 
     def resolve_customer(self, info, id):
         try:
@@ -356,14 +467,21 @@ class Query(graphene.ObjectType):
         except Order.DoesNotExist:
             return None
 
-    def resolve_all_customers(self, info):
-        return Customer.objects.all()
+    def resolve_all_customers(self, info, first=None, offset=None):
+        customers = only_selected(Customer.objects.all(), selected_fields(info, Customer))
+        return paginate(customers, first, offset)
+
+    def resolve_all_products(self, info, first=None, offset=None):
+        return paginate(cached_products(), first, offset)
 
-    def resolve_all_products(self, info):
-        return Product.objects.all()
+    def resolve_all_orders(self, info, first=None, offset=None):
+        return load_order_customers(info, paginate(order_queryset(info), first, offset))
 
-    def resolve_all_orders(self, info):
-        return Order.objects.all()
+    def resolve_orders(self, info, order_date__gte=None):
+        orders = order_queryset(info)
+        if order_date__gte:
+            orders = orders.filter(order_date__gte=order_date__gte)
+        return load_order_customers(info, orders)
 
 
 # ==================== Mutation Class ====================
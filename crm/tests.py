@@ -1,3 +1,269 @@
-from django.test import TestCase
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from . import views
+from .execution import ParallelExecutionContext
+from .models import Customer, Order, Product
+from .persisted_queries import HEARTBEAT_QUERY, query_id
+from .schema import schema
 
 # Create your tests here.
+
+MULTI_FIELD_QUERY = """
+{
+    hello
+    allCustomers { name email }
+    allProducts { name stock }
+    allOrders { totalAmount customer { email } }
+}
+"""
+
+
+class MultiFieldQueryMixin:
+    """Shared fixture and assertions for queries with several root fields."""
+
+    def create_data(self):
+        cache.clear()
+        customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        product = Product.objects.create(name="Laptop", price=Decimal("999.99"), stock=5)
+        order = Order.objects.create(customer=customer, total_amount=product.price)
+        order.products.set([product])
+
+    def execute(self):
+        """Run the query, returning the result and the fields sent to workers."""
+        with mock.patch.object(
+            ParallelExecutionContext,
+            '_execute_root_field',
+            autospec=True,
+            side_effect=ParallelExecutionContext._execute_root_field,
+        ) as root_field:
+            result = schema.execute(
+                MULTI_FIELD_QUERY,
+                context_value=RequestFactory().post('/graphql'),
+                execution_context_class=ParallelExecutionContext,
+            )
+        return result, sorted(call.args[4].key for call in root_field.call_args_list)
+
+    def assert_multi_field_result(self, result):
+        self.assertIsNone(result.errors)
+        self.assertEqual(list(result.data), ["hello", "allCustomers", "allProducts", "allOrders"])
+        self.assertEqual(result.data["hello"], "Hello, GraphQL!")
+        self.assertEqual(result.data["allCustomers"], [{"name": "Alice", "email": "alice@example.com"}])
+        self.assertEqual(result.data["allProducts"], [{"name": "Laptop", "stock": 5}])
+        self.assertEqual(
+            result.data["allOrders"],
+            [{"totalAmount": "999.99", "customer": {"email": "alice@example.com"}}],
+        )
+
+
+class ParallelExecutionInTransactionTests(MultiFieldQueryMixin, TestCase):
+    """Inside a transaction the root fields run serially and see its rows."""
+
+    def test_multi_field_query(self):
+        self.create_data()
+        result, parallel_fields = self.execute()
+        self.assert_multi_field_result(result)
+        self.assertEqual(parallel_fields, [])
+
+
+class ParallelExecutionTests(MultiFieldQueryMixin, TransactionTestCase):
+    """Outside a transaction the root fields run in the worker pool."""
+
+    def test_multi_field_query(self):
+        self.create_data()
+        result, parallel_fields = self.execute()
+        self.assert_multi_field_result(result)
+        self.assertEqual(parallel_fields, ["allCustomers", "allOrders", "allProducts"])
+
+
+class PaginationTests(TestCase):
+    """List fields reject negative pagination arguments the same way."""
+
+    def test_negative_arguments_are_rejected(self):
+        for field in ("allCustomers", "allProducts"):
+            for argument in ("first", "offset"):
+                with self.subTest(field=field, argument=argument):
+                    result = schema.execute(f"{{ {field}({argument}: -1) {{ name }} }}")
+                    self.assertEqual(
+                        [error.message for error in result.errors],
+                        [f"Argument '{argument}' must not be negative"],
+                    )
+
+
+class CreateOrderTests(TestCase):
+    """CreateOrder validates and prices products with a single product query."""
+
+    MUTATION = """
+    mutation($customerId: ID!, $productIds: [ID]!) {
+        createOrder(input: {customerId: $customerId, productIds: $productIds}) {
+            success
+            message
+            order { totalAmount }
+        }
+    }
+    """
+
+    def setUp(self):
+        self.customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        self.products = [
+            Product.objects.create(name=f"Product {i}", price=Decimal("1.50"), stock=5)
+            for i in range(3)
+        ]
+
+    def create_order(self, product_ids):
+        result = schema.execute(
+            self.MUTATION,
+            variable_values={"customerId": self.customer.pk, "productIds": product_ids},
+        )
+        self.assertIsNone(result.errors)
+        return result.data["createOrder"]
+
+    def test_repeated_product_ids_are_charged_per_listing(self):
+        product_id = self.products[0].pk
+        data = self.create_order([product_id, product_id])
+        self.assertTrue(data["success"])
+        self.assertEqual(data["order"]["totalAmount"], "3.00")
+
+    def test_all_missing_product_ids_are_reported(self):
+        data = self.create_order([self.products[0].pk, 998, 999])
+        self.assertFalse(data["success"])
+        self.assertEqual(data["message"], "Invalid product ID(s): 998, 999")
+        self.assertFalse(Order.objects.exists())
+
+    def test_product_lookup_does_not_grow_with_product_count(self):
+        with CaptureQueriesContext(connection) as one_product:
+            self.create_order([self.products[0].pk])
+        with CaptureQueriesContext(connection) as three_products:
+            self.create_order([product.pk for product in self.products])
+        self.assertEqual(len(three_products), len(one_product))
+
+
+class RestockLowStockTests(TestCase):
+    """Product.restock_low_stock adds stock in one UPDATE and bumps updated_at."""
+
+    def test_restocks_low_stock_products(self):
+        low = Product.objects.create(name="Low", price=Decimal("1.00"), stock=3)
+        full = Product.objects.create(name="Full", price=Decimal("1.00"), stock=50)
+        low_updated_at = low.updated_at
+
+        restocked = Product.restock_low_stock()
+
+        self.assertEqual(restocked, [{"id": low.pk, "name": "Low", "stock": 3}])
+        low.refresh_from_db()
+        full.refresh_from_db()
+        self.assertEqual(low.stock, 13)
+        self.assertGreater(low.updated_at, low_updated_at)
+        self.assertEqual(full.stock, 50)
+
+
+class CalculateTotalTests(TestCase):
+    """Order.calculate_total sums prices in the database and bumps updated_at."""
+
+    def test_calculate_total(self):
+        customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        order = Order.objects.create(customer=customer)
+        order.products.set([
+            Product.objects.create(name="A", price=Decimal("1.25"), stock=1),
+            Product.objects.create(name="B", price=Decimal("2.50"), stock=1),
+        ])
+        updated_at = order.updated_at
+
+        self.assertEqual(order.calculate_total(), Decimal("3.75"))
+        order.refresh_from_db()
+        self.assertEqual(order.total_amount, Decimal("3.75"))
+        self.assertGreater(order.updated_at, updated_at)
+
+
+class PersistedQueryTests(TestCase):
+    """The GraphQL view runs persisted queries by id, parsing each only once."""
+
+    def post(self, payload):
+        return self.client.post('/graphql', payload, content_type='application/json')
+
+    def test_persisted_query_is_parsed_once(self):
+        views._persisted_documents.clear()
+        with mock.patch('crm.views.parse', wraps=views.parse) as parse:
+            for _ in range(2):
+                response = self.post({"id": query_id(HEARTBEAT_QUERY)})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), {"data": {"hello": "Hello, GraphQL!"}})
+        self.assertEqual(parse.call_count, 1)
+
+    def test_unknown_id_is_reported(self):
+        response = self.post({"id": "unknown"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [error["message"] for error in response.json()["errors"]],
+            ["Persisted query not found: unknown"],
+        )
+
+
+class SelectedFieldsTests(TestCase):
+    """Column pruning covers every occurrence of a repeated field."""
+
+    def test_repeated_field_loads_all_selected_columns(self):
+        for i in range(3):
+            Customer.objects.create(name=f"Customer {i}", email=f"customer{i}@example.com")
+        with self.assertNumQueries(1):
+            result = schema.execute("{ allCustomers { name } allCustomers { email } }")
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["allCustomers"]), 3)
+        self.assertEqual(set(result.data["allCustomers"][0]), {"name", "email"})
+
+
+class OrderCustomerTests(TestCase):
+    """Order lists fetch all of a page's customers in one query."""
+
+    def test_customers_are_batched_without_request_context(self):
+        for i in range(5):
+            customer = Customer.objects.create(name=f"Customer {i}", email=f"customer{i}@example.com")
+            Order.objects.create(customer=customer)
+        with self.assertNumQueries(2):
+            result = schema.execute("{ orders { customer { email } } }")
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            sorted(order["customer"]["email"] for order in result.data["orders"]),
+            [f"customer{i}@example.com" for i in range(5)],
+        )
+
+
+class ProductCacheTests(TestCase):
+    """allProducts is served from the cache until products change."""
+
+    def setUp(self):
+        cache.clear()
+        Product.objects.create(name="Laptop", price=Decimal("999.99"), stock=5)
+
+    def product_stock(self):
+        result = schema.execute("{ allProducts { name stock } }")
+        self.assertIsNone(result.errors)
+        return {product["name"]: product["stock"] for product in result.data["allProducts"]}
+
+    def test_repeat_query_is_a_cache_hit(self):
+        self.assertEqual(self.product_stock(), {"Laptop": 5})
+        with self.assertNumQueries(0):
+            self.assertEqual(self.product_stock(), {"Laptop": 5})
+
+    def test_create_product_invalidates(self):
+        self.product_stock()
+        result = schema.execute(
+            'mutation { createProduct(input: {name: "Mouse", price: "9.99", stock: 20}) { success } }'
+        )
+        self.assertTrue(result.data["createProduct"]["success"])
+        self.assertEqual(self.product_stock(), {"Laptop": 5, "Mouse": 20})
+
+    def test_update_low_stock_products_invalidates(self):
+        self.product_stock()
+        result = schema.execute("mutation { updateLowStockProducts { message } }")
+        self.assertIsNone(result.errors)
+        self.assertEqual(self.product_stock(), {"Laptop": 15})
+
+    def test_model_delete_invalidates(self):
+        self.product_stock()
+        Product.objects.filter(name="Laptop").get().delete()
+        self.assertEqual(self.product_stock(), {})
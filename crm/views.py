@@ -1,3 +1,61 @@
-from django.shortcuts import render
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView
+from graphql import ExecutionResult, GraphQLError, execute, parse
+from graphql.validation import validate
 
-# Create your views here.
+from .persisted_queries import PERSISTED_QUERIES
+
+# Parsed and validated documents of persisted queries, keyed by (schema, id)
+_persisted_documents = {}
+
+
+class PersistedGraphQLView(GraphQLView):
+    """
+    GraphQL view that also accepts persisted queries sent by id.
+    Each persisted query is parsed and validated once per process; later
+    requests for the same id go straight to execution. Persisted queries are
+    read-only, so the mutation handling of the base view is not needed.
+    """
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        query_id = request.GET.get("id") or data.get("id")
+        if query or not query_id:
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+
+        if query_id not in PERSISTED_QUERIES:
+            return ExecutionResult(
+                errors=[GraphQLError(f"Persisted query not found: {query_id}")]
+            )
+
+        schema = self.schema.graphql_schema
+        document = _persisted_documents.get((schema, query_id))
+        if document is None:
+            document = parse(PERSISTED_QUERIES[query_id])
+            validation_errors = validate(
+                schema,
+                document,
+                self.validation_rules,
+                graphene_settings.MAX_VALIDATION_ERRORS,
+            )
+            if validation_errors:
+                return ExecutionResult(data=None, errors=validation_errors)
+            _persisted_documents[(schema, query_id)] = document
+
+        execute_options = {
+            "root_value": self.get_root_value(request),
+            "context_value": self.get_context(request),
+            "variable_values": variables,
+            "operation_name": operation_name,
+            "middleware": self.get_middleware(request),
+        }
+        if self.execution_context_class:
+            execute_options["execution_context_class"] = self.execution_context_class
+
+        try:
+            return execute(schema, document, **execute_options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])